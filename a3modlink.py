@@ -8,7 +8,9 @@ This script manages symbolic links for Arma 3 workshop mods by:
 3. Managing existing links (listing, removing, cleaning broken links)
 
 The script helps organize Arma 3 mod directories by creating meaningful
-symbolic links instead of using numeric workshop IDs.
+symbolic links instead of using numeric workshop IDs. Mod titles are cached
+in $XDG_CACHE_HOME/a3modlink/titles.json (~/.cache when unset) so repeated
+runs avoid the Steam API.
 
 Example usage:
     python modlink_manager.py --mods-dir ./mods --links-dir ./links --add 2183975396
@@ -18,18 +20,44 @@ Example usage:
 
 import argparse
 import errno
+import json
+import os
 import re
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Union
 
-import requests
-from requests.exceptions import RequestException
+if TYPE_CHECKING:
+    import requests
 
 # Configuration - should be configurable via CLI args
 STEAM_API = (
     "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
 )
 
+# Titles fetched from Steam are cached on disk and refreshed after a week
+TITLE_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "a3modlink"
+    / "titles.json"
+)
+TITLE_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Runs of characters that are not allowed in link names
+_NON_ALNUM_RUN = re.compile(r"[^a-zA-Z0-9]+")
+
+# Shared HTTP session, created by _get_session on first use
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+# Title cache loaded from TITLE_CACHE_FILE on first use
+_title_cache: Optional[Dict[str, dict]] = None
+_title_cache_lock = threading.Lock()
+
 
 def sanitise_path(path: str) -> str:
     """
@@ -51,10 +79,9 @@ def sanitise_path(path: str) -> str:
     if not path:
         return path
 
-    # Replace non-alphanumeric characters with underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", path)
-    # Collapse multiple underscores
-    return re.sub(r"_+", "_", sanitized)
+    # Replace each run of non-alphanumeric characters (underscores included)
+    # with a single underscore
+    return _NON_ALNUM_RUN.sub("_", path)
 
 
 def read_mods(mods_dir: str) -> List[str]:
@@ -77,18 +104,48 @@ def read_mods(mods_dir: str) -> List[str]:
         >>> read_mods("./mods")
         ['2183975396', '450814997', '333310405']
     """
-    mods_path = Path(mods_dir)
-    if not mods_path.exists() or not mods_path.is_dir():
-        raise ValueError(f"Mods directory does not exist: {mods_dir}")
+    return list(iter_unlinked_mods(mods_dir, set()))
+
+
+def iter_unlinked_mods(mods_dir: str, linked_ids: Set[str]) -> Iterator[str]:
+    """
+    Yield mod directories (workshop IDs) that have no link yet.
+
+    Streams the mods directory for subdirectories with numeric names,
+    skipping IDs in linked_ids before checking whether the entry is a
+    directory.
+
+    Args:
+        mods_dir: Path to the directory containing mod subdirectories
+        linked_ids: Workshop IDs that already have a link
 
-    return [
-        entry.name
-        for entry in mods_path.iterdir()
-        if entry.is_dir() and entry.name.isdigit()
-    ]
+    Yields:
+        str: Mod directory name (workshop ID)
 
+    Raises:
+        ValueError: If the mods directory does not exist
 
-def read_links(links_dir: str, sort: bool = True) -> Dict[str, str]:
+    Example:
+        >>> list(iter_unlinked_mods("./mods", {"450814997"}))
+        ['2183975396', '333310405']
+    """
+    try:
+        with os.scandir(mods_dir) as entries:
+            # Check the name first so non-ID entries never cost a stat
+            for entry in entries:
+                if (
+                    entry.name.isdigit()
+                    and entry.name not in linked_ids
+                    and entry.is_dir()
+                ):
+                    yield entry.name
+    except (FileNotFoundError, NotADirectoryError):
+        raise ValueError(f"Mods directory does not exist: {mods_dir}")
+
+
+def read_links(
+    links_dir: str, sort: bool = True, raw: bool = False
+) -> Dict[str, str]:
     """
     Read existing symbolic links and their targets.
 
@@ -99,6 +156,8 @@ def read_links(links_dir: str, sort: bool = True) -> Dict[str, str]:
     Args:
         links_dir: Path to the directory containing symbolic links
         sort: Whether to sort the results alphabetically by link name
+        raw: Whether to return targets exactly as stored in the links,
+             rather than as paths usable from the current directory
 
     Returns:
         Dict[str, str]: Dictionary mapping link names to target paths.
@@ -106,31 +165,181 @@ def read_links(links_dir: str, sort: bool = True) -> Dict[str, str]:
 
     Example:
         >>> read_links("./links")
-        {'cfba': '/path/mods/450814997', 'cba_a3': '/path/mods/333310405'}
+        {'cba_a3': './links/../mods/333310405', 'cfba': '/path/mods/450814997'}
+        >>> read_links("./links", raw=True)
+        {'cba_a3': '../mods/333310405', 'cfba': '/path/mods/450814997'}
     """
-    links_path = Path(links_dir)
-    if not links_path.exists():
+    results = {}
+    try:
+        with os.scandir(links_dir) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    try:
+                        target = os.readlink(entry.path)
+                    except OSError:
+                        continue
+                    # Relative targets are kept relative to the links directory
+                    if not raw:
+                        target = os.path.join(links_dir, target)
+                    results[entry.name] = target
+    except FileNotFoundError:
         return {}
 
-    results = {}
-    for entry in links_path.iterdir():
-        if entry.is_symlink():
+    return dict(sorted(results.items())) if sort else results
+
+
+def _get_session() -> "requests.Session":
+    """
+    Get the shared HTTP session used for Steam API requests.
+
+    requests is imported here rather than at module level so commands that
+    never contact Steam do not pay for loading it. The session pools
+    connections so they are reused across calls.
+
+    Returns:
+        requests.Session: Session with connection pooling and retries
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            _session = requests.Session()
+            _session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=16,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=None,
+                    ),
+                ),
+            )
+    return _session
+
+
+def _load_title_cache() -> Dict[str, dict]:
+    """
+    Load the on-disk title cache, reading the file at most once per run.
+
+    Returns:
+        Dict[str, dict]: Dictionary mapping workshop IDs to cache entries.
+                         Returns empty dict if the cache file is missing,
+                         unreadable or not a JSON object.
+    """
+    global _title_cache
+    if _title_cache is None:
+        try:
+            with open(TITLE_CACHE_FILE, encoding="utf-8") as f:
+                _title_cache = json.load(f)
+        except (OSError, ValueError):
+            _title_cache = {}
+        if not isinstance(_title_cache, dict):
+            _title_cache = {}
+    return _title_cache
+
+
+def _get_cached_title(mod_id: Union[int, str]) -> Optional[str]:
+    """
+    Get a mod title from the title cache if it has not expired.
+
+    Malformed entries are treated as missing, so the next successful fetch
+    overwrites them.
+
+    Args:
+        mod_id: Steam Workshop ID of the mod
+
+    Returns:
+        Optional[str]: Cached title, None if missing, malformed or expired
+    """
+    with _title_cache_lock:
+        entry = _load_title_cache().get(str(mod_id))
+
+    if not isinstance(entry, dict):
+        return None
+
+    title = entry.get("title")
+    fetched = entry.get("fetched")
+    if not isinstance(title, str) or not isinstance(fetched, (int, float)):
+        return None
+
+    if time.time() - fetched < TITLE_CACHE_TTL:
+        return title
+    return None
+
+
+def _cache_titles(titles: Dict[str, str]) -> None:
+    """
+    Add mod titles to the title cache and write it back to disk.
+
+    The cache file is replaced atomically so an interrupted write never
+    leaves a truncated file behind.
+
+    Args:
+        titles: Dictionary mapping workshop IDs (as strings) to titles
+    """
+    if not titles:
+        return
+
+    fetched = time.time()
+    with _title_cache_lock:
+        cache = _load_title_cache()
+        for mod_id, title in titles.items():
+            cache[mod_id] = {"title": title, "fetched": fetched}
+
+        tmp_path = TITLE_CACHE_FILE.with_name(f"{TITLE_CACHE_FILE.name}.{os.getpid()}")
+        try:
+            TITLE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, TITLE_CACHE_FILE)
+        except OSError as e:
+            print(f"Unable to write title cache {TITLE_CACHE_FILE}: {e}")
             try:
-                target_path = entry.resolve()
-                results[entry.name] = str(target_path)
+                os.unlink(tmp_path)
             except OSError:
-                # Broken symlink
-                continue
+                # Never created, or cannot be removed either
+                pass
 
-    return dict(sorted(results.items())) if sort else results
 
+def _fetch_mod_title(mod_id: Union[int, str]) -> Optional[str]:
+    """
+    Fetch a single mod title from Steam Workshop API, bypassing the cache.
 
-def get_mod_title(mod_id: int, lowercase: bool = True) -> Optional[str]:
+    Args:
+        mod_id: Steam Workshop ID of the mod
+
+    Returns:
+        Optional[str]: Mod title as published if successful, None if failed
+    """
+    from requests.exceptions import RequestException
+
+    form_data = {"itemcount": 1, "publishedfileids[0]": mod_id}
+
+    try:
+        response = _get_session().post(STEAM_API, data=form_data, timeout=10)
+        response.raise_for_status()
+
+        data = response.json()
+        return data["response"]["publishedfiledetails"][0]["title"]
+
+    except (RequestException, KeyError, IndexError) as e:
+        print(f"Error fetching title for mod {mod_id}: {e}")
+        return None
+
+
+def get_mod_title(mod_id: Union[int, str], lowercase: bool = True) -> Optional[str]:
     """
     Get mod title from Steam Workshop API.
 
     Fetches the title of a mod from the Steam Workshop API using the
-    mod's workshop ID. Handles network errors and API response parsing.
+    mod's workshop ID, unless a cached title is still fresh. Handles
+    network errors and API response parsing.
 
     Args:
         mod_id: Steam Workshop ID of the mod
@@ -143,56 +352,195 @@ def get_mod_title(mod_id: int, lowercase: bool = True) -> Optional[str]:
         >>> get_mod_title(333310405)
         'cba_a3'
     """
-    form_data = {"itemcount": 1, "publishedfileids[0]": mod_id}
+    title = _get_cached_title(mod_id)
+    if title is None:
+        title = _fetch_mod_title(mod_id)
+        if title is None:
+            return None
+        _cache_titles({str(mod_id): title})
 
-    try:
-        response = requests.post(STEAM_API, data=form_data, timeout=10)
-        response.raise_for_status()
+    return title.lower() if lowercase else title
 
-        data = response.json()
-        title = data["response"]["publishedfiledetails"][0]["title"]
-        return title.lower() if lowercase else title
 
-    except (RequestException, KeyError, IndexError) as e:
-        print(f"Error fetching title for mod {mod_id}: {e}")
+def get_mod_titles(mod_ids: List[str], lowercase: bool = True) -> Dict[str, str]:
+    """
+    Get titles for several mods from Steam Workshop API in one request.
+
+    Sends a single GetPublishedFileDetails request covering every given
+    workshop ID without a fresh cached title. IDs missing from the response,
+    or all of them if the request failed, are looked up one by one on a
+    small thread pool. Mods without a title are left out of the result.
+
+    Args:
+        mod_ids: Steam Workshop IDs of the mods
+        lowercase: Whether to return the titles in lowercase
+
+    Returns:
+        Dict[str, str]: Dictionary mapping workshop IDs (as strings) to titles.
+
+    Example:
+        >>> get_mod_titles(["333310405", "450814997"])
+        {'333310405': 'cba_a3', '450814997': 'cfba'}
+    """
+    titles = {}
+    uncached = []
+    for mod_id in mod_ids:
+        title = _get_cached_title(mod_id)
+        if title is None:
+            uncached.append(mod_id)
+        else:
+            titles[mod_id] = title
+
+    if uncached:
+        from requests.exceptions import RequestException
+
+        form_data = {"itemcount": len(uncached)}
+        for i, mod_id in enumerate(uncached):
+            form_data[f"publishedfileids[{i}]"] = mod_id
+
+        try:
+            response = _get_session().post(STEAM_API, data=form_data, timeout=10)
+            response.raise_for_status()
+
+            data = response.json()
+            details = data["response"]["publishedfiledetails"]
+        except (RequestException, KeyError) as e:
+            print(f"Error fetching titles for {len(uncached)} mod(s): {e}")
+            details = []
+
+        fetched = {}
+        answered = set()
+        for item in details:
+            mod_id = str(item.get("publishedfileid"))
+            answered.add(mod_id)
+            title = item.get("title")
+            if title:
+                fetched[mod_id] = title
+
+        # Retry individually only what Steam did not answer at all, capping
+        # the pool to stay within Steam rate limits
+        missing = [mod_id for mod_id in uncached if mod_id not in answered]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                results = executor.map(_fetch_mod_title, missing)
+                for mod_id, title in zip(missing, results):
+                    if title:
+                        fetched[mod_id] = title
+
+        _cache_titles(fetched)
+        titles.update(fetched)
+
+    if lowercase:
+        return {mod_id: title.lower() for mod_id, title in titles.items()}
+    return titles
+
+
+def _open_links_dir(links_dir: str) -> Optional[int]:
+    """
+    Open the links directory for use as dir_fd in link operations.
+
+    Resolving link names relative to an open directory saves the kernel
+    from walking the links directory path on every call.
+
+    Args:
+        links_dir: Directory containing the symbolic links
+
+    Returns:
+        Optional[int]: Directory file descriptor, None if the platform does
+                       not support dir_fd or the directory cannot be opened
+    """
+    # os.lstat is not listed in supports_dir_fd; it shares support with os.stat
+    if not {os.symlink, os.unlink, os.stat} <= os.supports_dir_fd:
         return None
 
+    try:
+        return os.open(links_dir, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return None
 
-def link_mod(mod_id: int, mods_dir: str, links_dir: str) -> bool:
+
+def _link_path(name: str, links_dir: str, links_fd: Optional[int]) -> str:
     """
-    Create symbolic link for a mod.
+    Build the path of a link, relative to links_fd when one is open.
+
+    Args:
+        name: Link name inside the links directory
+        links_dir: Directory containing the symbolic links
+        links_fd: Open descriptor of links_dir from _open_links_dir, if any
+
+    Returns:
+        str: The bare link name if links_fd is open, otherwise the link
+             name joined onto links_dir
+    """
+    return name if links_fd is not None else os.path.join(links_dir, name)
 
-    Creates a symbolic link from the mod's workshop ID directory to a
-    sanitized version of the mod's title. Handles errors during link
-    creation and validates that the source directory exists.
+
+def _mods_target_dir(mods_dir: str, links_dir: str) -> str:
+    """
+    Get the mods directory as a link target seen from the links directory.
+
+    A relative target is used where possible so links keep working when
+    the directories are moved or mounted elsewhere together.
+
+    Args:
+        mods_dir: Directory containing the mod subdirectories
+        links_dir: Directory where symbolic links are created
+
+    Returns:
+        str: Relative path from links_dir to mods_dir, or the absolute
+             mods_dir path if no relative path exists
+    """
+    mods_path = os.path.realpath(mods_dir)
+    try:
+        return os.path.relpath(mods_path, os.path.realpath(links_dir))
+    except ValueError:
+        # Directories on different drives (Windows)
+        return mods_path
+
+
+def _create_symlink(
+    mod_id: str,
+    title: Optional[str],
+    mods_dir: str,
+    links_dir: str,
+    links_fd: Optional[int] = None,
+    mods_target: Optional[str] = None,
+) -> bool:
+    """
+    Create the symbolic link for a mod whose title is already known.
 
     Args:
         mod_id: Steam Workshop ID of the mod to link
+        title: Mod title, or None if it could not be fetched
         mods_dir: Directory containing the mod subdirectories
         links_dir: Directory where symbolic links should be created
+        links_fd: Open descriptor of links_dir from _open_links_dir, if any
+        mods_target: mods_dir as seen from links_dir, from _mods_target_dir
 
     Returns:
         bool: True if link was created successfully, False otherwise
-
-    Example:
-        >>> link_mod(333310405, "./mods", "./links")
-        Created link: cba_a3 -> ./mods/333310405
-        True
     """
-    title = sanitise_path(get_mod_title(mod_id))
+    title = sanitise_path(title)
     if not title:
         print(f"Unable to get title for mod {mod_id}")
         return False
 
-    source_path = Path(mods_dir).resolve() / str(mod_id)
-    target_path = Path(links_dir) / title
-
-    if not source_path.exists():
-        print(f"Mod directory does not exist: {source_path}")
+    mod_path = os.path.join(mods_dir, mod_id)
+    if not os.path.exists(mod_path):
+        print(f"Mod directory does not exist: {mod_path}")
         return False
 
+    if mods_target is None:
+        mods_target = _mods_target_dir(mods_dir, links_dir)
+    source_path = os.path.join(mods_target, mod_id)
+
     try:
-        target_path.symlink_to(source_path, target_is_directory=True)
+        os.symlink(
+            source_path,
+            _link_path(title, links_dir, links_fd),
+            target_is_directory=True,
+            dir_fd=links_fd,
+        )
         print(f"Created link: {title} -> {source_path}")
         return True
     except OSError as e:
@@ -203,7 +551,43 @@ def link_mod(mod_id: int, mods_dir: str, links_dir: str) -> bool:
             return False
 
 
-def unlink_mod(titles: List[str], links_dir: str) -> None:
+def link_mod(
+    mod_id: Union[int, str],
+    mods_dir: str,
+    links_dir: str,
+    title: Optional[str] = None,
+    links_fd: Optional[int] = None,
+) -> bool:
+    """
+    Create symbolic link for a mod.
+
+    Creates a symbolic link from the mod's workshop ID directory to a
+    sanitized version of the mod's title. Handles errors during link
+    creation and validates that the source directory exists.
+
+    Args:
+        mod_id: Steam Workshop ID of the mod to link
+        mods_dir: Directory containing the mod subdirectories
+        links_dir: Directory where symbolic links should be created
+        title: Mod title if already known, otherwise fetched from Steam
+        links_fd: Open descriptor of links_dir from _open_links_dir, if any
+
+    Returns:
+        bool: True if link was created successfully, False otherwise
+
+    Example:
+        >>> link_mod(333310405, "./mods", "./links")
+        Created link: cba_a3 -> ../mods/333310405
+        True
+    """
+    if title is None:
+        title = get_mod_title(mod_id)
+    return _create_symlink(str(mod_id), title, mods_dir, links_dir, links_fd)
+
+
+def unlink_mod(
+    titles: List[str], links_dir: str, links_fd: Optional[int] = None
+) -> None:
     """
     Remove symbolic links.
 
@@ -214,26 +598,52 @@ def unlink_mod(titles: List[str], links_dir: str) -> None:
     Args:
         titles: List of link names to remove
         links_dir: Directory containing the symbolic links
+        links_fd: Open descriptor of links_dir from _open_links_dir, if any
 
     Example:
         >>> unlink_mod(["cba_a3", "cfba"], "./links")
         Removed link: cba_a3
         Removed link: cfba
     """
-    links_path = Path(links_dir)
     for title in titles:
-        link_path = links_path / title
-        if link_path.exists() and link_path.is_symlink():
-            try:
-                link_path.unlink()
-                print(f"Removed link: {title}")
-            except OSError as e:
-                print(f"Unable to remove link {title}: {e}")
-        else:
-            print(f"Link not found or not a symlink: {title}")
+        link_path = _link_path(title, links_dir, links_fd)
+        try:
+            # Never remove real files or directories that share a link name
+            if not stat.S_ISLNK(os.lstat(link_path, dir_fd=links_fd).st_mode):
+                print(f"Not a symlink: {title}")
+                continue
+            os.unlink(link_path, dir_fd=links_fd)
+            print(f"Removed link: {title}")
+        except FileNotFoundError:
+            print(f"Link not found: {title}")
+        except OSError as e:
+            print(f"Unable to remove link {title}: {e}")
 
 
-def remove_broken_links(links_dir: str) -> None:
+def _target_missing(target_path: str) -> bool:
+    """
+    Check whether a link target no longer exists.
+
+    Targets that cannot be resolved (a missing path, a non-directory in
+    the path, or a symlink loop) count as missing. Any other error, such
+    as a permission error, leaves the link alone.
+
+    Args:
+        target_path: Path the symbolic link points to
+
+    Returns:
+        bool: True if the target does not exist, False otherwise
+    """
+    try:
+        os.stat(target_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return True
+    except OSError as e:
+        return e.errno == errno.ELOOP
+    return False
+
+
+def remove_broken_links(links_dir: str, links_fd: Optional[int] = None) -> None:
     """
     Remove broken symbolic links.
 
@@ -243,6 +653,7 @@ def remove_broken_links(links_dir: str) -> None:
 
     Args:
         links_dir: Directory containing the symbolic links
+        links_fd: Open descriptor of links_dir from _open_links_dir, if any
 
     Example:
         >>> remove_broken_links("./links")
@@ -252,14 +663,23 @@ def remove_broken_links(links_dir: str) -> None:
     links = read_links(links_dir, sort=False)
     broken_count = 0
 
-    for name, target_path in links.items():
-        if not Path(target_path).exists():
-            try:
-                (Path(links_dir) / name).unlink()
-                print(f"Removed broken link: {name}")
-                broken_count += 1
-            except OSError as e:
-                print(f"Unable to remove broken link {name}: {e}")
+    # Check targets concurrently since each stat may wait on a slow filesystem
+    broken = []
+    if links:
+        with ThreadPoolExecutor(max_workers=min(16, len(links))) as executor:
+            missing = executor.map(_target_missing, links.values())
+            broken = [name for name, gone in zip(links, missing) if gone]
+
+    for name in broken:
+        try:
+            os.unlink(_link_path(name, links_dir, links_fd), dir_fd=links_fd)
+            print(f"Removed broken link: {name}")
+            broken_count += 1
+        except FileNotFoundError:
+            # Already removed by someone else
+            continue
+        except OSError as e:
+            print(f"Unable to remove broken link {name}: {e}")
 
     if broken_count == 0:
         print("No broken links found.")
@@ -329,27 +749,55 @@ def main():
 
     # Execute requested operations
     if args.list:
-        links = read_links(args.links_dir)
+        links = read_links(args.links_dir, raw=True)
         if links:
-            print(f"{'Title':<40} {'Target':<40}")
-            print("=" * 80)
-            for title, target in links.items():
-                print(f"{title:<40} {target:<40}")
+            lines = ["Title".ljust(40) + " " + "Target".ljust(40), "=" * 80]
+            lines.extend(
+                title.ljust(40) + " " + target.ljust(40)
+                for title, target in links.items()
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("No links found.")
 
-    if args.add is not None:
-        mod_ids = args.add if args.add else read_mods(args.mods_dir)
-        for mod_id in mod_ids:
-            exist_link = Path(args.links_dir).resolve() / str(mod_id)
-            if not (exist_link.exists() or exist_link.is_symlink()):
-                link_mod(mod_id, args.mods_dir, args.links_dir)
-
-    if args.unlink:
-        unlink_mod(args.unlink, args.links_dir)
-
-    if args.broken:
-        remove_broken_links(args.links_dir)
+    # Open the links directory once for all link changes
+    links_fd = None
+    if args.add is not None or args.unlink or args.broken:
+        links_fd = _open_links_dir(args.links_dir)
+    try:
+        if args.add is not None:
+            # Skip mods that already have a link pointing at them
+            linked_ids = {
+                os.path.basename(target)
+                for target in read_links(args.links_dir, sort=False).values()
+            }
+            if args.add:
+                pending = sorted({str(mod_id) for mod_id in args.add} - linked_ids)
+            else:
+                pending = sorted(iter_unlinked_mods(args.mods_dir, linked_ids))
+
+            # Fetch all titles in one request, then create the links locally
+            titles = get_mod_titles(pending)
+
+            mods_target = _mods_target_dir(args.mods_dir, args.links_dir)
+            for mod_id in pending:
+                _create_symlink(
+                    mod_id,
+                    titles.get(mod_id),
+                    args.mods_dir,
+                    args.links_dir,
+                    links_fd,
+                    mods_target,
+                )
+
+        if args.unlink:
+            unlink_mod(args.unlink, args.links_dir, links_fd)
+
+        if args.broken:
+            remove_broken_links(args.links_dir, links_fd)
+    finally:
+        if links_fd is not None:
+            os.close(links_fd)
 
 
 if __name__ == "__main__":